@@ -1,10 +1,564 @@
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
-from io import StringIO
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from io import BytesIO, StringIO
+from concurrent.futures import ThreadPoolExecutor
+from numba import njit
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+# st.cache_data is shared by every session on the server, and every upload
+# gets a new file_id. Upload-keyed results therefore expire after CACHE_TTL,
+# and the entry cap is set well above the number of people likely to use the
+# app at once, so one session's reruns don't push out another's upload.
+CACHE_TTL = '1h'
+UPLOAD_CACHE_ENTRIES = 32
+# Tables and figures derived from the filtered overlaps, one per upload and
+# filter combination; the timeline alone can hold tens of thousands of points
+VIEW_CACHE_ENTRIES = 64
+
+
+@njit(cache=True, nogil=True)
+def sweep_overlap_pairs(end_order, ends_before, agent_codes, is_lunch):
+    """Sweep intervals given in start order and return the local index pairs
+    (i < j) of overlapping intervals from different agents where at least one
+    of them is on lunch. end_order lists the intervals by end time and
+    ends_before[k] is how many of them end no later than interval k starts."""
+    n = len(agent_codes)
+    # Open intervals per group (0 = other, 1 = lunch), stored densely; slot
+    # remembers each interval's position so removal is a swap with the last one.
+    # Keeping the groups apart means pairs with no lunch are never visited.
+    active = np.empty((2, n), dtype=np.int64)
+    n_active = np.zeros(2, dtype=np.int64)
+    slot = np.empty(n, dtype=np.int64)
+    # Output columns, grown by doubling and trimmed at the end
+    capacity = max(n, 16)
+    pair_i = np.empty(capacity, dtype=np.int32)
+    pair_j = np.empty(capacity, dtype=np.int32)
+    found = 0
+    closed = 0
+    for idx in range(n):
+        # Close everything that ended before (or as) this interval starts
+        while closed < ends_before[idx]:
+            done = end_order[closed]
+            group = 1 if is_lunch[done] else 0
+            last = active[group, n_active[group] - 1]
+            active[group, slot[done]] = last
+            slot[last] = slot[done]
+            n_active[group] -= 1
+            closed += 1
+
+        group = 1 if is_lunch[idx] else 0
+        # Lunch intervals pair with both groups, others only with lunches
+        for other_group in range(1 - group, 2):
+            for k in range(n_active[other_group]):
+                other = active[other_group, k]
+                if agent_codes[other] == agent_codes[idx]:
+                    continue
+                if found == capacity:
+                    capacity *= 2
+                    grown_i = np.empty(capacity, dtype=np.int32)
+                    grown_j = np.empty(capacity, dtype=np.int32)
+                    grown_i[:found] = pair_i
+                    grown_j[:found] = pair_j
+                    pair_i = grown_i
+                    pair_j = grown_j
+                pair_i[found] = other
+                pair_j[found] = idx
+                found += 1
+        active[group, n_active[group]] = idx
+        slot[idx] = n_active[group]
+        n_active[group] += 1
+
+    return pair_i[:found].copy(), pair_j[:found].copy()
+
+
+def block_overlap_pairs(block, starts, ends, agent_codes, is_lunch):
+    """Run the sweep over the intervals at positions `block` (sorted by start)
+    and return the overlapping pairs as positions into the full arrays."""
+    # Only intervals that are still open when another one starts can overlap
+    # it, so each new interval is compared against the active set instead of
+    # every other record. Starts are already sorted; ends are sorted on their
+    # own and merged in with searchsorted. side='right' closes intervals that
+    # end exactly when the next one starts: touching intervals don't overlap.
+    block_ends = ends[block]
+    end_order = np.argsort(block_ends, kind='stable')
+    ends_before = np.searchsorted(block_ends[end_order], starts[block], side='right')
+
+    pair_i, pair_j = sweep_overlap_pairs(
+        end_order, ends_before, agent_codes[block], is_lunch[block]
+    )
+    # Local positions follow start order, so map back and put the earlier record first
+    pair_i, pair_j = block[pair_i], block[pair_j]
+    return np.minimum(pair_i, pair_j), np.maximum(pair_i, pair_j)
+
+
+def parse_duration_seconds(durations):
+    """Seconds in each 'HH:MM:SS' duration string; missing values count as zero."""
+    seconds = np.zeros(len(durations), dtype=np.int64)
+    present = durations.notna().values
+    text = durations[present]
+    if len(text) == 0:
+        return seconds
+    # The export always uses fixed-width HH:MM:SS, so read the digits straight
+    # from their byte offsets. Anything else goes through pd.to_timedelta.
+    if (text.str.len() == 8).all():
+        raw = np.asarray(text.to_numpy(dtype=object), dtype='S8').view(np.uint8).reshape(-1, 8)
+        digits = raw[:, [0, 1, 3, 4, 6, 7]].astype(np.int64) - ord('0')
+        if (raw[:, [2, 5]] == ord(':')).all() and ((digits >= 0) & (digits <= 9)).all():
+            seconds[present] = (
+                (digits[:, 0] * 10 + digits[:, 1]) * 3600
+                + (digits[:, 2] * 10 + digits[:, 3]) * 60
+                + digits[:, 4] * 10 + digits[:, 5]
+            )
+            return seconds
+    seconds[present] = pd.to_timedelta(text).dt.total_seconds().values.astype(np.int64)
+    return seconds
+
+
+def format_durations(seconds):
+    """Format a Series of whole seconds as 'Hh Mm Ss' strings."""
+    whole_seconds = seconds.astype(np.int64)
+    return (
+        (whole_seconds // 3600).astype(str) + 'h '
+        + (whole_seconds % 3600 // 60).astype(str) + 'm '
+        + (whole_seconds % 60).astype(str) + 's'
+    )
+
+
+@st.cache_data(max_entries=UPLOAD_CACHE_ENTRIES, ttl=CACHE_TTL)
+def load_and_preprocess(file_id, _file_bytes):
+    """Read the uploaded CSV and add start/end datetimes to its Not Ready records.
+
+    The file is streamed in blocks and only the Not Ready rows are kept; the
+    rest is reduced to the counts behind the summary metrics, returned as a
+    dict alongside the Not Ready frame.
+
+    Cached on the upload's file_id; the leading underscore keeps Streamlit
+    from hashing the raw bytes on every rerun."""
+    # Parse with Arrow directly so repeated labels are dictionary-encoded while
+    # reading and arrive in pandas as categoricals without a second pass.
+    # Date/time text columns are pinned to strings so Arrow doesn't infer times.
+    label = pa.dictionary(pa.int32(), pa.string())
+    reader = pa_csv.open_csv(
+        BytesIO(_file_bytes),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={
+                'DATE': pa.string(), 'TIME': pa.string(), 'AGENT STATE TIME': pa.string(),
+                'STATE': label, 'REASON CODE': label, 'AGENT': label
+            },
+            # Only the columns the app reads; other columns are skipped rather
+            # than having their types guessed from the first block
+            include_columns=['DATE', 'TIME', 'STATE', 'REASON CODE', 'AGENT STATE TIME', 'AGENT'],
+            # Empty cells are missing values, as with pd.read_csv
+            strings_can_be_null=True
+        )
+    )
+
+    record_count = 0
+    agents = set()
+    reason_counts = {}
+    not_ready_batches = []
+    for batch in reader:
+        record_count += batch.num_rows
+        agents.update(pc.unique(batch['AGENT']).to_pylist())
+        for entry in pc.value_counts(batch['REASON CODE']).to_pylist():
+            reason_counts[entry['values']] = reason_counts.get(entry['values'], 0) + entry['counts']
+        # Process Not Ready states
+        not_ready_batches.append(batch.filter(pc.equal(batch['STATE'], 'Not Ready')))
+    agents.discard(None)
+    reason_counts.pop(None, None)
+
+    file_summary = {
+        'records': record_count,
+        'agents': len(agents),
+        'reason_counts': pd.Series(reason_counts, dtype=np.int64)
+    }
+    not_ready_table = pa.Table.from_batches(not_ready_batches, schema=reader.schema)
+    not_ready_batches.clear()
+    # Free each Arrow column as soon as it is converted so the Not Ready rows
+    # are never held in both formats at once
+    not_ready_df = not_ready_table.to_pandas(split_blocks=True, self_destruct=True)
+    del not_ready_table
+
+    # Convert date and time to datetime
+    start_datetime = pd.to_datetime(
+        not_ready_df['DATE'] + ' ' + not_ready_df['TIME'],
+        format='%Y/%m/%d %H:%M:%S'
+    )
+
+    # Parse durations; missing ones count as zero
+    durations = pd.to_timedelta(parse_duration_seconds(not_ready_df['AGENT STATE TIME']), unit='s')
+
+    not_ready_df = not_ready_df.assign(
+        start_datetime=start_datetime,
+        end_datetime=start_datetime + durations
+    )
+
+    return file_summary, not_ready_df
+
+
+@st.cache_data(max_entries=UPLOAD_CACHE_ENTRIES, ttl=CACHE_TTL, show_spinner='Finding lunch-related overlaps...')
+def compute_overlaps(file_id, _file_bytes, lunch_codes):
+    """Return one row per overlap between Not Ready periods of two different
+    agents where at least one of them is on lunch."""
+    _, not_ready_df = load_and_preprocess(file_id, _file_bytes)
+
+    # Mark lunch records
+    is_lunch = not_ready_df['REASON CODE'].isin(lunch_codes).values
+
+    # Work on the raw column arrays rather than per-row dicts, with times as
+    # int64 seconds since the epoch so all overlap math is plain integer ops
+    starts = not_ready_df['start_datetime'].values.astype('datetime64[s]').view('i8')
+    ends = not_ready_df['end_datetime'].values.astype('datetime64[s]').view('i8')
+    # Agents are compared by their categorical codes and only mapped back to
+    # names for the output. A missing agent never matches anyone, so each
+    # one gets a code of its own past the end of the categories.
+    agents = not_ready_df['AGENT'].cat
+    agent_codes = agents.codes.values.astype(np.int32)
+    missing_agents = np.flatnonzero(agent_codes < 0)
+    agent_codes[missing_agents] = len(agents.categories) + np.arange(len(missing_agents), dtype=np.int32)
+    agent_names = np.concatenate([
+        np.asarray(agents.categories, dtype=object),
+        np.full(len(missing_agents), np.nan, dtype=object)
+    ])
+    reasons = not_ready_df['REASON CODE'].values
+
+    # Zero-length intervals can never overlap
+    valid = np.flatnonzero(ends > starts)
+
+    # A non-lunch record can only pair with a lunch, so merge the lunch
+    # intervals into disjoint spans and drop non-lunch records that fall
+    # entirely outside them before the sweep ever sees them
+    lunch = valid[is_lunch[valid]]
+    other = valid[~is_lunch[valid]]
+    if len(lunch) > 0:
+        lunch = lunch[np.argsort(starts[lunch], kind='stable')]
+        lunch_reach = np.maximum.accumulate(ends[lunch])
+        span_firsts = np.r_[0, np.flatnonzero(starts[lunch][1:] >= lunch_reach[:-1]) + 1]
+        span_starts = starts[lunch][span_firsts]
+        span_ends = lunch_reach[np.r_[span_firsts[1:] - 1, len(lunch) - 1]]
+        # First span ending after each record starts; it overlaps if it starts before the record ends
+        span = np.searchsorted(span_ends, starts[other], side='right')
+        touches = span < len(span_ends)
+        touches[touches] = span_starts[span[touches]] < ends[other[touches]]
+        other = other[touches]
+    else:
+        other = other[:0]
+    valid = np.concatenate([lunch, other])
+
+    # An interval that starts once everything before it has ended can't
+    # overlap anything earlier, so the sweep runs on each such block
+    # separately: effectively one block per day, with records that run
+    # past midnight kept whole.
+    valid = valid[np.argsort(starts[valid], kind='stable')]
+    reach = np.maximum.accumulate(ends[valid])
+    breaks = np.flatnonzero(starts[valid][1:] >= reach[:-1]) + 1
+
+    # Blocks are independent, so they are swept in parallel; the compiled
+    # kernel releases the GIL, so plain threads are enough. Neighbouring
+    # blocks are merged into about one similar-sized chunk per CPU, still
+    # cut only at block boundaries, so isolated records don't each cost a task.
+    chunk_count = min(os.cpu_count() or 1, len(breaks) + 1)
+    cut_at = np.searchsorted(breaks, np.arange(1, chunk_count) * len(valid) // chunk_count)
+    chunks = np.split(valid, np.unique(breaks[cut_at[cut_at < len(breaks)]]))
+    if len(chunks) == 1:
+        block_pairs = [block_overlap_pairs(valid, starts, ends, agent_codes, is_lunch)]
+    else:
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            block_pairs = list(executor.map(
+                lambda chunk: block_overlap_pairs(chunk, starts, ends, agent_codes, is_lunch),
+                chunks
+            ))
+    pair_i = np.concatenate([pairs[0] for pairs in block_pairs])
+    pair_j = np.concatenate([pairs[1] for pairs in block_pairs])
+
+    # Emit pairs in record order
+    pair_order = np.lexsort((pair_j, pair_i))
+    pair_i = pair_i[pair_order]
+    pair_j = pair_j[pair_order]
+
+    # Overlap bounds for all pairs at once
+    overlap_start_seconds = np.maximum(starts[pair_i], starts[pair_j])
+    overlap_end_seconds = np.minimum(ends[pair_i], ends[pair_j])
+    overlap_seconds = overlap_end_seconds - overlap_start_seconds
+    overlap_durations = overlap_seconds.astype(np.float64)
+    overlap_starts = pd.Series(pd.to_datetime(overlap_start_seconds, unit='s'))
+    overlap_ends = pd.to_datetime(overlap_end_seconds, unit='s')
+
+    agents_1 = agent_names[agent_codes[pair_i]]
+    agents_2 = agent_names[agent_codes[pair_j]]
+    lunch_1 = is_lunch[pair_i]
+    lunch_2 = is_lunch[pair_j]
+
+    # Determine overlap type
+    overlap_types = np.where(
+        lunch_1 & lunch_2,
+        "Both on Lunch",
+        np.where(lunch_1, np.char.add(agents_1.astype(str), " on Lunch"), np.char.add(agents_2.astype(str), " on Lunch"))
+    )
+
+    day_numbers = overlap_starts.dt.dayofweek.values.astype(np.int8)
+
+    return pd.DataFrame({
+        'Agent 1': agents_1,
+        'Agent 2': agents_2,
+        'Overlap Start': overlap_starts,
+        'Overlap End': overlap_ends,
+        'Duration (seconds)': overlap_durations,
+        'Agent 1 Reason': reasons[pair_i],
+        'Agent 2 Reason': reasons[pair_j],
+        'Agent 1 On Lunch': lunch_1,
+        'Agent 2 On Lunch': lunch_2,
+        'Overlap Type': overlap_types,
+        # Calendar fields for the pattern tabs, so reruns only filter them
+        'Hour': overlap_starts.dt.hour.astype(np.int8),
+        'Day Number': day_numbers,
+        'Day of Week': pd.Categorical.from_codes(day_numbers, categories=DAY_ORDER, ordered=True)
+    })
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def compute_agent_stats(filtered_df):
+    """Per-agent overlap counts and durations, busiest agents first."""
+    # One row per (overlap, agent) so a single groupby covers both sides
+    long_columns = ['Agent', 'On Lunch', 'Duration (seconds)']
+    long_df = pd.concat([
+        filtered_df[['Agent 1', 'Agent 1 On Lunch', 'Duration (seconds)']].set_axis(long_columns, axis=1),
+        filtered_df[['Agent 2', 'Agent 2 On Lunch', 'Duration (seconds)']].set_axis(long_columns, axis=1)
+    ], ignore_index=True)
+    
+    agent_stats_df = long_df.groupby('Agent').agg(
+        total=('Duration (seconds)', 'count'),
+        on_lunch=('On Lunch', 'sum'),
+        seconds=('Duration (seconds)', 'sum'),
+        mean_seconds=('Duration (seconds)', 'mean')
+    )
+    
+    return pd.DataFrame({
+        'Agent': agent_stats_df.index,
+        'Total Overlaps': agent_stats_df['total'].values,
+        'Agent on Lunch': agent_stats_df['on_lunch'].values,
+        # Overlaps where this agent is NOT on lunch (but someone else is)
+        'Agent Working (Other on Lunch)': (agent_stats_df['total'] - agent_stats_df['on_lunch']).values,
+        'Total Overlap Time (minutes)': agent_stats_df['seconds'].values / 60,
+        'Avg Overlap Duration (minutes)': agent_stats_df['mean_seconds'].values / 60
+    }).sort_values('Total Overlap Time (minutes)', ascending=False)
+
+
+@st.cache_data(max_entries=UPLOAD_CACHE_ENTRIES, ttl=CACHE_TTL)
+def compute_peak_concurrent_lunches(file_id, _file_bytes, lunch_codes):
+    """Most lunch periods open at the same moment during each hour of the day,
+    counted from the lunch intervals directly instead of from overlap pairs."""
+    _, not_ready_df = load_and_preprocess(file_id, _file_bytes)
+    lunch_df = not_ready_df[not_ready_df['REASON CODE'].isin(lunch_codes)]
+    starts = lunch_df['start_datetime'].values.astype('datetime64[s]').view('i8')
+    ends = lunch_df['end_datetime'].values.astype('datetime64[s]').view('i8')
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    
+    peak = np.zeros(24, dtype=np.int64)
+    if len(starts) > 0:
+        # +1 at each start, -1 at each end, plus a zero mark on every hour so no
+        # stretch between two events spans more than one clock hour
+        hour_marks = np.arange(starts.min() // 3600, ends.max() // 3600 + 1) * 3600
+        times = np.concatenate([starts, ends, hour_marks])
+        deltas = np.concatenate([
+            np.ones(len(starts), dtype=np.int64),
+            -np.ones(len(ends), dtype=np.int64),
+            np.zeros(len(hour_marks), dtype=np.int64)
+        ])
+        # Only the level after the last event at each time is read below, and
+        # that is the same whatever order tied events come in, so sorting on
+        # time alone is enough: a lunch ending as another starts isn't concurrent
+        order = np.argsort(times)
+        times = times[order]
+        levels = np.cumsum(deltas[order])
+        
+        # The level after each point holds until the next one
+        spans = times[1:] > times[:-1]
+        np.maximum.at(peak, (times[:-1][spans] // 3600) % 24, levels[:-1][spans])
+    
+    return pd.Series(peak, index=pd.RangeIndex(24, name='Hour'))
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def compute_hourly_counts(filtered_df):
+    """Number of overlaps per hour of day and overlap type."""
+    return filtered_df.groupby(['Hour', 'Overlap Type'])['Duration (seconds)'].count().reset_index()
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def compute_daily_stats(filtered_df):
+    """Overlap count and total time per day of week, Monday first."""
+    # Day of week patterns; the ordered categorical keeps the groups Monday first
+    daily_stats = filtered_df.groupby(['Day of Week', 'Day Number'], observed=True).agg({
+        'Duration (seconds)': ['count', 'sum']
+    }).reset_index()
+    daily_stats.columns = ['Day of Week', 'Day Number', 'Count', 'Total Seconds']
+    daily_stats['Total Minutes'] = daily_stats['Total Seconds'] / 60
+    return daily_stats
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_type_pie(overlap_type_counts):
+    return px.pie(
+        values=overlap_type_counts.values,
+        names=overlap_type_counts.index,
+        title="Distribution of Lunch Overlap Types"
+    )
+
+
+def build_details_table(overlap_df):
+    """Columns shown in the overlap details table and report, with durations formatted."""
+    details_df = overlap_df[[
+        'Agent 1', 'Agent 2', 'Overlap Start', 'Overlap End', 
+        'Duration (seconds)', 'Agent 1 Reason', 'Agent 2 Reason', 'Overlap Type'
+    ]]
+    return details_df.assign(**{
+        'Duration (seconds)': format_durations(details_df['Duration (seconds)'])
+    }).rename(columns={'Duration (seconds)': 'Duration (formatted)'})
+
+
+# Above this many overlaps the timeline is binned rather than drawn point by point
+TIMELINE_MAX_POINTS = 50_000
+# Rows per page of the overlap details table
+DETAILS_PAGE_SIZE = 1_000
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_timeline_fig(timeline_df):
+    # Timeline visualization with lunch focus, drawn with WebGL
+    if len(timeline_df) <= TIMELINE_MAX_POINTS:
+        timeline_df = timeline_df.assign(**{
+            'Duration (formatted)': format_durations(timeline_df['Duration (seconds)'])
+        })
+        fig = px.scatter(timeline_df, 
+                       x='Overlap Start', 
+                       y='Duration (seconds)',
+                       color='Overlap Type',
+                       size='Duration (seconds)',
+                       hover_data=['Agent 1', 'Agent 2', 'Agent 1 Reason', 'Agent 2 Reason', 'Duration (formatted)'],
+                       render_mode='webgl',
+                       title="Lunch Overlap Timeline")
+    else:
+        # Too many marks for the browser: one point per 5-minute bin and
+        # overlap type, at the longest overlap in the bin, sized by count
+        binned_df = timeline_df.groupby(
+            [timeline_df['Overlap Start'].dt.floor('5min'), 'Overlap Type'], observed=True
+        )['Duration (seconds)'].agg(['max', 'count']).reset_index()
+        binned_df.columns = ['Overlap Start', 'Overlap Type', 'Duration (seconds)', 'Overlaps']
+        fig = px.scatter(binned_df,
+                       x='Overlap Start',
+                       y='Duration (seconds)',
+                       color='Overlap Type',
+                       size='Overlaps',
+                       render_mode='webgl',
+                       title="Lunch Overlap Timeline (longest overlap per 5 minutes)")
+    fig.update_layout(height=500)
+    return fig
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_schedule_fig(lunch_schedule):
+    fig_schedule = px.bar(lunch_schedule,
+                        x='Hour',
+                        y='Duration (seconds)',
+                        color='Overlap Type',
+                        title="Lunch Overlaps by Hour of Day",
+                        labels={'Duration (seconds)': 'Number of Overlaps'})
+    fig_schedule.update_xaxes(dtick=1, title="Hour of Day")
+    fig_schedule.update_layout(height=400)
+    return fig_schedule
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_agent_fig(agent_stats_df):
+    # Stacked bar chart
+    fig_agent = go.Figure()
+    fig_agent.add_trace(go.Bar(
+        name='Agent on Lunch',
+        x=agent_stats_df['Agent'],
+        y=agent_stats_df['Agent on Lunch'],
+        marker_color='lightcoral'
+    ))
+    fig_agent.add_trace(go.Bar(
+        name='Agent Working (Other on Lunch)',
+        x=agent_stats_df['Agent'],
+        y=agent_stats_df['Agent Working (Other on Lunch)'],
+        marker_color='lightblue'
+    ))
+    
+    fig_agent.update_layout(
+        title='Agent Involvement in Lunch Overlaps',
+        xaxis_title='Agent',
+        yaxis_title='Number of Overlaps',
+        barmode='stack',
+        height=500
+    )
+    return fig_agent
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_day_fig(daily_stats):
+    fig_day = px.bar(daily_stats,
+                   x='Day of Week',
+                   y='Count',
+                   title='Lunch Overlaps by Day of Week',
+                   color='Count',
+                   color_continuous_scale='Blues')
+    fig_day.update_xaxes(categoryorder='array', categoryarray=DAY_ORDER)
+    return fig_day
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_duration_fig(durations_df):
+    # Lunch duration analysis
+    duration_stats = durations_df.groupby('Overlap Type')['Duration (seconds)'].agg(['mean', 'median', 'std']).reset_index()
+    duration_stats.columns = ['Overlap Type', 'Mean (sec)', 'Median (sec)', 'Std Dev (sec)']
+    duration_stats['Mean (min)'] = duration_stats['Mean (sec)'] / 60
+    duration_stats['Median (min)'] = duration_stats['Median (sec)'] / 60
+    
+    return px.bar(duration_stats,
+                  x='Overlap Type',
+                  y='Mean (min)',
+                  title='Average Overlap Duration by Type',
+                  color='Mean (min)',
+                  color_continuous_scale='Reds')
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_time_dist_fig(time_dist):
+    return px.bar(x=time_dist.index, y=time_dist.values,
+                  title="Lunch Overlap Distribution by Time Period",
+                  labels={'x': 'Time Period', 'y': 'Number of Overlaps'})
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_risk_fig(coverage_risk):
+    fig_risk = px.bar(x=coverage_risk.index, y=coverage_risk.values,
+                    title="Coverage Risk by Hour (Both Agents on Lunch)",
+                    labels={'x': 'Hour', 'y': 'Number of Incidents'},
+                    color=coverage_risk.values,
+                    color_continuous_scale='Reds')
+    fig_risk.update_xaxes(dtick=1)
+    return fig_risk
+
+
+@st.cache_data(max_entries=VIEW_CACHE_ENTRIES, ttl=CACHE_TTL)
+def build_peak_lunch_fig(peak_lunches):
+    fig_peak = px.bar(x=peak_lunches.index, y=peak_lunches.values,
+                    title="Peak Concurrent Lunches by Hour",
+                    labels={'x': 'Hour', 'y': 'Lunch Records Open at Once'})
+    fig_peak.update_xaxes(dtick=1)
+    return fig_peak
+
 
 st.set_page_config(
     page_title="Agent Lunch Overlap ",
@@ -32,95 +586,26 @@ uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
 
 if uploaded_file is not None:
     # Read the CSV
-    df = pd.read_csv(uploaded_file)
+    file_summary, not_ready_df = load_and_preprocess(uploaded_file.file_id, uploaded_file.getvalue())
     
     # Show basic info
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Records", len(df))
+        st.metric("Total Records", file_summary['records'])
     with col2:
-        st.metric("Unique Agents", df['AGENT'].nunique())
+        st.metric("Unique Agents", file_summary['agents'])
     with col3:
-        st.metric("Not Ready Records", len(df[df['STATE'] == 'Not Ready']))
+        st.metric("Not Ready Records", len(not_ready_df))
     with col4:
-        lunch_records = len(df[df['REASON CODE'].isin(lunch_codes)])
+        reason_counts = file_summary['reason_counts']
+        lunch_records = int(reason_counts[reason_counts.index.isin(lunch_codes)].sum())
         st.metric("Lunch Records", lunch_records)
     
-    # Process Not Ready states
-    not_ready_df = df[df['STATE'] == 'Not Ready'].copy()
-    
     if len(not_ready_df) > 0:
-        # Convert date and time to datetime
-        not_ready_df['start_datetime'] = pd.to_datetime(
-            not_ready_df['DATE'] + ' ' + not_ready_df['TIME'],
-            format='%Y/%m/%d %H:%M:%S'
-        )
-        
-        # Parse duration to seconds
-        def parse_duration(duration_str):
-            if pd.isna(duration_str):
-                return 0
-            parts = duration_str.split(':')
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-        
-        not_ready_df['duration_seconds'] = not_ready_df['AGENT STATE TIME'].apply(parse_duration)
-        not_ready_df['end_datetime'] = not_ready_df['start_datetime'] + pd.to_timedelta(not_ready_df['duration_seconds'], unit='s')
-        
-        # Mark lunch records
-        not_ready_df['is_lunch'] = not_ready_df['REASON CODE'].isin(lunch_codes)
-        
         # Find overlaps where at least one agent is on lunch
-        overlaps = []
-        records = not_ready_df.to_dict('records')
-        
-        with st.spinner('Finding lunch-related overlaps...'):
-            for i in range(len(records)):
-                for j in range(i + 1, len(records)):
-                    rec1 = records[i]
-                    rec2 = records[j]
-                    
-                    # Skip if same agent
-                    if rec1['AGENT'] == rec2['AGENT']:
-                        continue
-                    
-                    # Check if at least one agent is on lunch
-                    if not (rec1['is_lunch'] or rec2['is_lunch']):
-                        continue
-                    
-                    # Check overlap
-                    overlap_start = max(rec1['start_datetime'], rec2['start_datetime'])
-                    overlap_end = min(rec1['end_datetime'], rec2['end_datetime'])
-                    
-                    if overlap_start < overlap_end:
-                        overlap_duration = (overlap_end - overlap_start).total_seconds()
-                        
-                        # Determine overlap type
-                        if rec1['is_lunch'] and rec2['is_lunch']:
-                            overlap_type = "Both on Lunch"
-                        elif rec1['is_lunch']:
-                            overlap_type = f"{rec1['AGENT']} on Lunch"
-                        else:
-                            overlap_type = f"{rec2['AGENT']} on Lunch"
-                        
-                        overlaps.append({
-                            'Agent 1': rec1['AGENT'],
-                            'Agent 2': rec2['AGENT'],
-                            'Overlap Start': overlap_start,
-                            'Overlap End': overlap_end,
-                            'Duration (seconds)': overlap_duration,
-                            'Duration (formatted)': f"{int(overlap_duration//3600)}h {int((overlap_duration%3600)//60)}m {int(overlap_duration%60)}s",
-                            'Agent 1 Reason': rec1['REASON CODE'],
-                            'Agent 2 Reason': rec2['REASON CODE'],
-                            'Agent 1 On Lunch': rec1['is_lunch'],
-                            'Agent 2 On Lunch': rec2['is_lunch'],
-                            'Overlap Type': overlap_type,
-                            'Date': overlap_start.date(),
-                            'Hour': overlap_start.hour
-                        })
-        
-        if overlaps:
-            overlap_df = pd.DataFrame(overlaps)
-            
+        overlap_df = compute_overlaps(uploaded_file.file_id, uploaded_file.getvalue(), tuple(lunch_codes))
+
+        if len(overlap_df) > 0:
             # Summary metrics
             st.header("Lunch Overlap Summary")
             col1, col2, col3, col4 = st.columns(4)
@@ -142,12 +627,8 @@ if uploaded_file is not None:
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                fig_pie = px.pie(
-                    values=overlap_type_counts.values,
-                    names=overlap_type_counts.index,
-                    title="Distribution of Lunch Overlap Types"
-                )
-                st.plotly_chart(fig_pie, use_container_width=True)
+                fig_pie = build_type_pie(overlap_type_counts)
+                st.plotly_chart(fig_pie, use_container_width=True, key='type_pie')
             
             with col2:
                 st.markdown("**Breakdown:**")
@@ -182,33 +663,42 @@ if uploaded_file is not None:
                 )
             
             with col4:
+                first_date = overlap_df['Overlap Start'].min().date()
+                last_date = overlap_df['Overlap Start'].max().date()
                 date_range = st.date_input(
                     "Date Range",
-                    value=(overlap_df['Date'].min(), overlap_df['Date'].max()),
-                    min_value=overlap_df['Date'].min(),
-                    max_value=overlap_df['Date'].max()
+                    value=(first_date, last_date),
+                    min_value=first_date,
+                    max_value=last_date
                 )
             
             # Apply filters
-            filtered_df = overlap_df.copy()
+            mask = np.ones(len(overlap_df), dtype=bool)
             
             if selected_agents:
-                filtered_df = filtered_df[
-                    (filtered_df['Agent 1'].isin(selected_agents)) | 
-                    (filtered_df['Agent 2'].isin(selected_agents))
-                ]
+                mask &= overlap_df['Agent 1'].isin(selected_agents).values | overlap_df['Agent 2'].isin(selected_agents).values
             
             if overlap_types:
-                filtered_df = filtered_df[filtered_df['Overlap Type'].isin(overlap_types)]
+                mask &= overlap_df['Overlap Type'].isin(overlap_types).values
             
             if min_duration > 0:
-                filtered_df = filtered_df[filtered_df['Duration (seconds)'] >= min_duration]
+                mask &= overlap_df['Duration (seconds)'].values >= min_duration
             
             if len(date_range) == 2:
-                filtered_df = filtered_df[
-                    (filtered_df['Date'] >= date_range[0]) & 
-                    (filtered_df['Date'] <= date_range[1])
-                ]
+                # Compare the datetime64 start column against day bounds rather
+                # than Python date objects one by one
+                overlap_starts = overlap_df['Overlap Start'].values
+                mask &= (
+                    (overlap_starts >= np.datetime64(date_range[0], 'D')) & 
+                    (overlap_starts < np.datetime64(date_range[1], 'D') + np.timedelta64(1, 'D'))
+                )
+            
+            # Boolean indexing always copies, so skip it when nothing is filtered out
+            filtered_df = overlap_df if mask.all() else overlap_df[mask]
+            
+            # Hourly counts are shared by the schedule, pattern and coverage tabs
+            hourly_counts = compute_hourly_counts(filtered_df)
+            hour_totals = hourly_counts.groupby('Hour')['Duration (seconds)'].sum()
             
             # Visualizations
             st.header("Lunch Overlap")
@@ -216,37 +706,26 @@ if uploaded_file is not None:
             tab1, tab2, tab3, tab4, tab5 = st.tabs(["Timeline", "Lunch Schedule", "Agent Impact", "Lunch Patterns", "Coverage Analysis"])
             
             with tab1:
-                # Timeline visualization with lunch focus
-                fig = px.scatter(filtered_df, 
-                               x='Overlap Start', 
-                               y='Duration (seconds)',
-                               color='Overlap Type',
-                               size='Duration (seconds)',
-                               hover_data=['Agent 1', 'Agent 2', 'Agent 1 Reason', 'Agent 2 Reason', 'Duration (formatted)'],
-                               title="Lunch Overlap Timeline")
-                fig.update_layout(height=500)
-                st.plotly_chart(fig, use_container_width=True)
+                # Only the plotted columns go into the cache key
+                fig = build_timeline_fig(filtered_df[[
+                    'Overlap Start', 'Duration (seconds)', 'Overlap Type',
+                    'Agent 1', 'Agent 2', 'Agent 1 Reason', 'Agent 2 Reason'
+                ]])
+                st.plotly_chart(fig, use_container_width=True, key='timeline')
             
             with tab2:
                 # Lunch schedule heatmap
                 st.subheader("Lunch Time Patterns")
                 
                 # Create lunch schedule data
-                lunch_schedule = filtered_df.groupby(['Hour', 'Overlap Type'])['Duration (seconds)'].count().reset_index()
+                lunch_schedule = hourly_counts
                 lunch_schedule['Duration (minutes)'] = lunch_schedule['Duration (seconds)'] / 60
                 
-                fig_schedule = px.bar(lunch_schedule,
-                                    x='Hour',
-                                    y='Duration (seconds)',
-                                    color='Overlap Type',
-                                    title="Lunch Overlaps by Hour of Day",
-                                    labels={'Duration (seconds)': 'Number of Overlaps'})
-                fig_schedule.update_xaxes(dtick=1, title="Hour of Day")
-                fig_schedule.update_layout(height=400)
-                st.plotly_chart(fig_schedule, use_container_width=True)
+                fig_schedule = build_schedule_fig(lunch_schedule)
+                st.plotly_chart(fig_schedule, use_container_width=True, key='schedule')
                 
                 # Peak lunch times
-                peak_hours = filtered_df.groupby('Hour')['Duration (seconds)'].count().sort_values(ascending=False).head(5)
+                peak_hours = hour_totals.sort_values(ascending=False).head(5)
                 st.subheader("Peak Lunch Overlap Hours")
                 for hour, count in peak_hours.items():
                     st.markdown(f"• **{hour:02d}:00 - {hour:02d}:59**: {count} overlaps")
@@ -255,58 +734,10 @@ if uploaded_file is not None:
                 # Agent impact analysis
                 st.subheader("Agent Lunch Impact")
                 
-                agent_stats = []
-                all_agents = set(filtered_df['Agent 1'].unique()) | set(filtered_df['Agent 2'].unique())
-                
-                for agent in all_agents:
-                    agent_overlaps = filtered_df[
-                        (filtered_df['Agent 1'] == agent) | 
-                        (filtered_df['Agent 2'] == agent)
-                    ]
-                    
-                    # Count overlaps where this agent is on lunch
-                    agent_on_lunch = len(agent_overlaps[
-                        ((filtered_df['Agent 1'] == agent) & (filtered_df['Agent 1 On Lunch'])) |
-                        ((filtered_df['Agent 2'] == agent) & (filtered_df['Agent 2 On Lunch']))
-                    ])
-                    
-                    # Count overlaps where this agent is NOT on lunch (but someone else is)
-                    agent_not_on_lunch = len(agent_overlaps) - agent_on_lunch
-                    
-                    agent_stats.append({
-                        'Agent': agent,
-                        'Total Overlaps': len(agent_overlaps),
-                        'Agent on Lunch': agent_on_lunch,
-                        'Agent Working (Other on Lunch)': agent_not_on_lunch,
-                        'Total Overlap Time (minutes)': agent_overlaps['Duration (seconds)'].sum() / 60,
-                        'Avg Overlap Duration (minutes)': agent_overlaps['Duration (seconds)'].mean() / 60 if len(agent_overlaps) > 0 else 0
-                    })
+                agent_stats_df = compute_agent_stats(filtered_df)
                 
-                agent_stats_df = pd.DataFrame(agent_stats).sort_values('Total Overlap Time (minutes)', ascending=False)
-                
-                # Stacked bar chart
-                fig_agent = go.Figure()
-                fig_agent.add_trace(go.Bar(
-                    name='Agent on Lunch',
-                    x=agent_stats_df['Agent'],
-                    y=agent_stats_df['Agent on Lunch'],
-                    marker_color='lightcoral'
-                ))
-                fig_agent.add_trace(go.Bar(
-                    name='Agent Working (Other on Lunch)',
-                    x=agent_stats_df['Agent'],
-                    y=agent_stats_df['Agent Working (Other on Lunch)'],
-                    marker_color='lightblue'
-                ))
-                
-                fig_agent.update_layout(
-                    title='Agent Involvement in Lunch Overlaps',
-                    xaxis_title='Agent',
-                    yaxis_title='Number of Overlaps',
-                    barmode='stack',
-                    height=500
-                )
-                st.plotly_chart(fig_agent, use_container_width=True)
+                fig_agent = build_agent_fig(agent_stats_df)
+                st.plotly_chart(fig_agent, use_container_width=True, key='agent_impact')
                 
                 # Agent stats table
                 st.subheader("Agent Statistics")
@@ -317,54 +748,25 @@ if uploaded_file is not None:
                 # Lunch pattern analysis
                 st.subheader("Lunch Pattern")
                 
-                # Day of week patterns
-                filtered_df['Day of Week'] = filtered_df['Overlap Start'].dt.day_name()
-                filtered_df['Day Number'] = filtered_df['Overlap Start'].dt.dayofweek
-                
-                day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                daily_stats = filtered_df.groupby(['Day of Week', 'Day Number']).agg({
-                    'Duration (seconds)': ['count', 'sum']
-                }).reset_index()
-                daily_stats.columns = ['Day of Week', 'Day Number', 'Count', 'Total Seconds']
-                daily_stats['Total Minutes'] = daily_stats['Total Seconds'] / 60
-                daily_stats = daily_stats.sort_values('Day Number')
+                daily_stats = compute_daily_stats(filtered_df)
                 
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    fig_day = px.bar(daily_stats,
-                                   x='Day of Week',
-                                   y='Count',
-                                   title='Lunch Overlaps by Day of Week',
-                                   color='Count',
-                                   color_continuous_scale='Blues')
-                    fig_day.update_xaxes(categoryorder='array', categoryarray=day_order)
-                    st.plotly_chart(fig_day, use_container_width=True)
+                    fig_day = build_day_fig(daily_stats)
+                    st.plotly_chart(fig_day, use_container_width=True, key='day_of_week')
                 
                 with col2:
-                    # Lunch duration analysis
-                    duration_stats = filtered_df.groupby('Overlap Type')['Duration (seconds)'].agg(['mean', 'median', 'std']).reset_index()
-                    duration_stats.columns = ['Overlap Type', 'Mean (sec)', 'Median (sec)', 'Std Dev (sec)']
-                    duration_stats['Mean (min)'] = duration_stats['Mean (sec)'] / 60
-                    duration_stats['Median (min)'] = duration_stats['Median (sec)'] / 60
-                    
-                    fig_duration = px.bar(duration_stats,
-                                        x='Overlap Type',
-                                        y='Mean (min)',
-                                        title='Average Overlap Duration by Type',
-                                        color='Mean (min)',
-                                        color_continuous_scale='Reds')
-                    st.plotly_chart(fig_duration, use_container_width=True)
+                    fig_duration = build_duration_fig(filtered_df[['Overlap Type', 'Duration (seconds)']])
+                    st.plotly_chart(fig_duration, use_container_width=True, key='duration_by_type')
                 
                 # Time distribution
                 st.subheader("Lunch Time Distribution")
-                time_bins = pd.cut(filtered_df['Hour'], bins=range(0, 25, 2), right=False, labels=[f"{i:02d}-{i+1:02d}" for i in range(0, 24, 2)])
-                time_dist = time_bins.value_counts().sort_index()
+                time_dist = hour_totals.reindex(range(24), fill_value=0).groupby(np.arange(24) // 2).sum()
+                time_dist.index = [f"{i:02d}-{i+1:02d}" for i in range(0, 24, 2)]
                 
-                fig_time_dist = px.bar(x=time_dist.index, y=time_dist.values,
-                                     title="Lunch Overlap Distribution by Time Period",
-                                     labels={'x': 'Time Period', 'y': 'Number of Overlaps'})
-                st.plotly_chart(fig_time_dist, use_container_width=True)
+                fig_time_dist = build_time_dist_fig(time_dist)
+                st.plotly_chart(fig_time_dist, use_container_width=True, key='time_distribution')
             
             with tab5:
                 # Coverage analysis
@@ -386,53 +788,62 @@ if uploaded_file is not None:
                 
                 with col2:
                     # Coverage risk by hour
-                    coverage_risk = both_lunch_df.groupby('Hour')['Duration (seconds)'].count()
+                    coverage_risk = hourly_counts[hourly_counts['Overlap Type'] == 'Both on Lunch'].set_index('Hour')['Duration (seconds)']
                     if len(coverage_risk) > 0:
-                        fig_risk = px.bar(x=coverage_risk.index, y=coverage_risk.values,
-                                        title="Coverage Risk by Hour (Both Agents on Lunch)",
-                                        labels={'x': 'Hour', 'y': 'Number of Incidents'},
-                                        color=coverage_risk.values,
-                                        color_continuous_scale='Reds')
-                        fig_risk.update_xaxes(dtick=1)
-                        st.plotly_chart(fig_risk, use_container_width=True)
+                        fig_risk = build_risk_fig(coverage_risk)
+                        st.plotly_chart(fig_risk, use_container_width=True, key='coverage_risk')
                     else:
                         st.info("No periods found where both agents were simultaneously on lunch.")
                 
+                # Concurrency straight from the lunch intervals
+                st.subheader("Peak Concurrent Lunches")
+                peak_lunches = compute_peak_concurrent_lunches(uploaded_file.file_id, uploaded_file.getvalue(), tuple(lunch_codes))
+                fig_peak = build_peak_lunch_fig(peak_lunches)
+                st.plotly_chart(fig_peak, use_container_width=True, key='peak_lunches')
+                st.caption("Counts every lunch record in the file; the filters above do not apply.")
+                
                 # Recommendations
                 st.subheader("Coverage Recommendations")
                 if len(both_lunch_df) > 0:
-                    peak_risk_hour = both_lunch_df.groupby('Hour')['Duration (seconds)'].count().idxmax()
+                    peak_risk_hour = coverage_risk.idxmax()
                     st.warning(f"⚠️ **High Risk Period**: {peak_risk_hour:02d}:00-{peak_risk_hour:02d}:59 has the most simultaneous lunch overlaps")
                     
                     # Most problematic agent pairs
                     problematic_pairs = both_lunch_df.groupby(['Agent 1', 'Agent 2'])['Duration (seconds)'].agg(['count', 'sum']).reset_index()
                     problematic_pairs.columns = ['Agent 1', 'Agent 2', 'Incidents', 'Total Duration']
-                    problematic_pairs = problematic_pairs.sort_values('Incidents', ascending=False).head(5)
+                    # Partial top-5 selection rather than sorting every pair
+                    problematic_pairs = problematic_pairs.nlargest(5, 'Incidents')
                     
                     st.markdown("**Most Frequent Simultaneous Lunch Pairs:**")
-                    for _, row in problematic_pairs.iterrows():
-                        minutes = row['Total Duration'] / 60
-                        st.markdown(f"• {row['Agent 1']} & {row['Agent 2']}: {row['Incidents']} incidents ({minutes:.0f} min total)")
+                    for agent_1, agent_2, incidents, total_duration in zip(
+                        problematic_pairs['Agent 1'], problematic_pairs['Agent 2'],
+                        problematic_pairs['Incidents'], problematic_pairs['Total Duration']
+                    ):
+                        minutes = total_duration / 60
+                        st.markdown(f"• {agent_1} & {agent_2}: {incidents} incidents ({minutes:.0f} min total)")
                 else:
                     st.success("No periods found where multiple agents were simultaneously on lunch")
             
             # Detailed table
             st.header("Lunch Overlap Details")
             
-            # Format the display dataframe
-            display_columns = [
-                'Agent 1', 'Agent 2', 'Overlap Start', 'Overlap End', 
-                'Duration (formatted)', 'Agent 1 Reason', 'Agent 2 Reason', 'Overlap Type'
-            ]
-            display_df = filtered_df[display_columns].sort_values('Overlap Start', ascending=False)
+            # Newest first, but only one page of rows goes to the browser
+            newest_first = filtered_df['Overlap Start'].sort_values(ascending=False).index
+            page_count = max(1, -(-len(newest_first) // DETAILS_PAGE_SIZE))
+            page = 1
+            if page_count > 1:
+                page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+            page_rows = newest_first[(page - 1) * DETAILS_PAGE_SIZE:page * DETAILS_PAGE_SIZE]
             
-            st.dataframe(display_df, use_container_width=True, hide_index=True)
+            st.dataframe(build_details_table(filtered_df.loc[page_rows]), use_container_width=True, hide_index=True)
+            if page_count > 1:
+                st.caption(f"Showing overlaps {(page - 1) * DETAILS_PAGE_SIZE + 1:,}-"
+                           f"{(page - 1) * DETAILS_PAGE_SIZE + len(page_rows):,} of {len(newest_first):,}")
             
-            # Download option
-            csv = display_df.to_csv(index=False)
+            # Download option; the full report is only written out when clicked
             st.download_button(
                 label="Download Lunch Overlap Report as CSV",
-                data=csv,
+                data=lambda: build_details_table(filtered_df.loc[newest_first]).to_csv(index=False),
                 file_name=f"lunch_overlaps_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
@@ -444,6 +855,7 @@ if uploaded_file is not None:
             if len(not_ready_df) > 0:
                 st.subheader("Available Reason Codes in Data")
                 reason_codes = not_ready_df['REASON CODE'].value_counts()
+                reason_codes = reason_codes[reason_codes > 0]
                 st.dataframe(reason_codes.reset_index().rename(columns={'index': 'Reason Code', 'REASON CODE': 'Count'}))
                 st.markdown("**Tip**: Check if your lunch reason codes match those in the data. You can modify them in the sidebar.")
     else: